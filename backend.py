@@ -1,99 +1,142 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-import requests
+from starlette.concurrency import run_in_threadpool
+import httpx
+import asyncio
+import multiprocessing
 import json
-from typing import List, Dict, Any, Optional, Tuple
-from pydantic import BaseModel
-import warnings
-from urllib3.exceptions import InsecureRequestWarning
+import orjson
+import hashlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from collections import defaultdict
+from urllib.parse import quote
+from typing import List, Dict, Any, Optional, Tuple, Callable, BinaryIO
+from pydantic import BaseModel, ConfigDict
+from cachetools import TTLCache
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from io import BytesIO
-from datetime import datetime, timedelta
-import tempfile
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles.numbers import BUILTIN_FORMATS_REVERSE
+from openpyxl.utils import get_column_letter
+from openpyxl.writer.excel import ExcelWriter
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from io import TextIOWrapper
+from tempfile import SpooledTemporaryFile
+from xml.sax.saxutils import quoteattr
+import re
+import zipfile
+import zlib
+from datetime import datetime
+from pathlib import Path
 import os
 import sys
 import webbrowser
 import threading
-import hashlib
+import time
+import logging
 
-# HTTPS 인증서 경고 무시
-warnings.simplefilter("ignore", InsecureRequestWarning)
-
-app = FastAPI(title="Nutanix Cluster Manager API")
+# 로깅 설정 - 캐시 상세 로그는 DEBUG 레벨이라 기본 설정(INFO)에서는 출력되지 않음
+logging.basicConfig(level=logging.INFO)
+# httpx는 요청마다 INFO 로그를 남기므로 경고 이상만 출력
+logging.getLogger("httpx").setLevel(logging.WARNING)
+log = logging.getLogger(__name__)
 
 # ============ 캐싱 시스템 ============
-# 캐시 저장소: {cache_key: (data, timestamp)}
-cache_storage: Dict[str, Tuple[List[Dict[str, Any]], datetime]] = {}
-
 # 캐시 TTL (Time To Live) - 5분
 CACHE_TTL_MINUTES = 5
+CACHE_TTL_SECS = CACHE_TTL_MINUTES * 60
+
+# 캐시 최대 항목 수 - 초과 시 만료된 항목을 먼저 정리하고, 그래도 가득 차면 가장 오래 사용되지 않은 항목(LRU)부터 제거
+CACHE_MAX_ITEMS = 1024
+
+# 캐시 저장소: {cache_key: (payload, timestamp)} - payload는 직렬화된 JSON bytes, timestamp는 cache-stats 표시용 time.monotonic() 값
+# (TTLCache의 만료 판정도 time.monotonic 기준)
+# cache_key는 (cluster_id, category, ...) 튜플이며 첫 요소가 항상 클러스터 ID
+cache_storage: TTLCache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=CACHE_TTL_SECS)
+
+# 클러스터 이름 캐시: {cluster_id: cluster_name}
+_cluster_name_cache: TTLCache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=CACHE_TTL_SECS)
 
-def generate_cache_key(cluster_id: str, category: str, **params) -> str:
-    """캐시 키 생성 - 클러스터 ID, 카테고리, 추가 파라미터 기반"""
+def generate_cache_key(cluster_id: str, category: str, **params) -> Tuple:
+    """캐시 키 생성 - 클러스터 ID, 카테고리, 추가 파라미터 기반 튜플"""
     # Performance의 경우 시간 파라미터도 포함
     if category == "Performance":
-        key_parts = [
+        return (
             cluster_id,
             category,
-            str(params.get('startTime', '')),
-            str(params.get('endTime', '')),
-            str(params.get('interval', '')),
-            str(params.get('aggregationType', ''))
-        ]
+            params.get('startTime'),
+            params.get('endTime'),
+            params.get('interval'),
+            params.get('aggregationType')
+        )
     elif category == "Resources":
-        key_parts = [
+        return (
             cluster_id,
             category,
-            str(params.get('ratio', '')),
-            str(params.get('rf', '')),
-            str(params.get('cvmVcore', '')),
-            str(params.get('cvmMemory', ''))
-        ]
-    else:
-        key_parts = [cluster_id, category]
-    
-    key_string = "|".join(key_parts)
-    return hashlib.md5(key_string.encode()).hexdigest()
-
-def get_cached_data(cache_key: str) -> Optional[List[Dict[str, Any]]]:
-    """캐시에서 데이터 가져오기 - TTL 체크"""
-    if cache_key in cache_storage:
-        data, timestamp = cache_storage[cache_key]
-        # TTL 체크
-        if datetime.now() - timestamp < timedelta(minutes=CACHE_TTL_MINUTES):
-            print(f"[CACHE HIT] Key: {cache_key}")
-            return data
-        else:
-            # 만료된 캐시 삭제
-            print(f"[CACHE EXPIRED] Key: {cache_key}")
-            del cache_storage[cache_key]
+            params.get('ratio'),
+            params.get('rf'),
+            params.get('cvmVcore'),
+            params.get('cvmMemory')
+        )
+    return (cluster_id, category)
+
+def get_cached_data(cache_key: Tuple) -> Optional[bytes]:
+    """캐시에서 데이터 가져오기 - 만료 항목은 TTLCache가 자동 제거"""
+    cached = cache_storage.get(cache_key)
+    if cached is not None:
+        log.debug("[CACHE HIT] Key: %s", cache_key)
+        return cached[0]
     
-    print(f"[CACHE MISS] Key: {cache_key}")
+    log.debug("[CACHE MISS] Key: %s", cache_key)
     return None
 
-def set_cached_data(cache_key: str, data: List[Dict[str, Any]]) -> None:
-    """캐시에 데이터 저장"""
-    cache_storage[cache_key] = (data, datetime.now())
-    print(f"[CACHE SET] Key: {cache_key}, Items: {len(data)}")
+def set_cached_data(cache_key: Tuple, payload: bytes) -> None:
+    """캐시에 직렬화된 JSON 저장"""
+    cache_storage[cache_key] = (payload, time.monotonic())
+    log.debug("[CACHE SET] Key: %s, Bytes: %d", cache_key, len(payload))
 
 def clear_cache(cluster_id: Optional[str] = None) -> None:
     """캐시 삭제 - 특정 클러스터 또는 전체"""
     if cluster_id:
         # 특정 클러스터의 캐시만 삭제
-        keys_to_delete = [k for k in cache_storage.keys() if k.startswith(cluster_id)]
+        keys_to_delete = [k for k in list(cache_storage.keys()) if k[0] == cluster_id]
         for key in keys_to_delete:
             del cache_storage[key]
-        print(f"[CACHE CLEAR] Cluster: {cluster_id}")
+        _cluster_name_cache.pop(cluster_id, None)
+        log.info("[CACHE CLEAR] Cluster: %s", cluster_id)
     else:
         # 전체 캐시 삭제
         cache_storage.clear()
-        print(f"[CACHE CLEAR] All cache cleared")
+        _cluster_name_cache.clear()
+        log.info("[CACHE CLEAR] All cache cleared")
 # ============ 캐싱 시스템 끝 ============
 
-app = FastAPI(title="Nutanix Cluster Manager API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - Nutanix API 호출용 공유 HTTP 클라이언트와 집계용 프로세스 풀 생성/종료"""
+    # 커넥션 풀을 재사용하여 요청마다 TLS 핸드셰이크를 반복하지 않음
+    app.state.http = httpx.AsyncClient(
+        verify=False,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        http2=True
+    )
+    # 긴 기간의 통계 집계를 이벤트 루프 밖에서 처리 (워커 프로세스는 첫 작업 시 생성됨)
+    app.state.pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 61))  # Windows 최대 61개
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+        app.state.pool.shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(
+    title="Nutanix Cluster Manager API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # CORS 설정
 app.add_middleware(
@@ -121,8 +164,26 @@ if os.path.exists(STATIC_DIR):
     # 루트 레벨의 정적 파일들 (이미지 등)
     app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
+# 빌드된 정적 파일 목록 (dist 기준 상대 경로, '/' 구분) - 요청마다 파일 시스템을 조회하지 않도록 시작 시 한 번만 수집
+STATIC_FILES = frozenset(
+    path.relative_to(STATIC_DIR).as_posix()
+    for path in Path(STATIC_DIR).rglob("*")
+    if path.is_file()
+)
+
+# index.html은 빌드 후 바뀌지 않으므로 시작 시 한 번만 읽어 메모리에서 응답
+INDEX_HTML: Optional[bytes] = None
+INDEX_ETAG = ""
+if "index.html" in STATIC_FILES:
+    with open(os.path.join(STATIC_DIR, "index.html"), "rb") as f:
+        INDEX_HTML = f.read()
+    INDEX_ETAG = f'"{hashlib.md5(INDEX_HTML, usedforsecurity=False).hexdigest()}"'
+
 # 데이터 모델
 class ClusterConfig(BaseModel):
+    # 요청 처리 중 변경하지 않으므로 불변 모델로 사용, 프론트엔드의 추가 필드는 무시
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     id: str
     name: str
     ip: str
@@ -132,60 +193,140 @@ class ClusterConfig(BaseModel):
     type: str = "PE"
     apiVersion: str = "v2.0"
 
-class DataRow(BaseModel):
-    clusterName: str = ""
-    name: str = ""
-    uuid: str = ""
-    powerState: str = ""
-    ipAddresses: str = ""
-    numVcpus: int = 0
-    memoryMb: int = 0
-
 # Nutanix API 헬퍼 함수들
 def get_api_url(ip: str, endpoint: str) -> str:
     return f"https://{ip}:9440/api/nutanix/v2.0{endpoint}"
 
-def nutanix_fetch(url: str, cluster: ClusterConfig, timeout_secs: int = 15) -> Dict[str, Any]:
+async def nutanix_fetch(url: str, cluster: ClusterConfig, timeout_secs: int = 15) -> Dict[str, Any]:
     auth = (cluster.username, cluster.password)
 
     try:
-        response = requests.get(
+        response = await app.state.http.get(
             url,
             auth=auth,
-            verify=False,
             timeout=timeout_secs
         )
+        response.raise_for_status()
 
-        if not response.ok:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Nutanix API Error: {response.status_code} {response.reason}"
-            )
-
-        return response.json()
-    except requests.exceptions.Timeout:
+        return orjson.loads(response.content)
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Nutanix API Error: {e.response.status_code} {e.response.reason_phrase}"
+        )
+    except httpx.TimeoutException:
         raise HTTPException(status_code=408, detail=f"Timeout: Server at {cluster.ip} did not respond in {timeout_secs}s")
-    except requests.exceptions.ConnectionError:
+    except httpx.TransportError:
         raise HTTPException(status_code=503, detail=f"Connection failed: Cannot connect to {cluster.ip}")
 
-def get_cluster_name(cluster: ClusterConfig) -> str:
-    """클러스터 이름 가져오기"""
+# Performance 통계 동시 요청 수 제한 (대형 클러스터에서 Prism 과부하 방지)
+STATS_FETCH_CONCURRENCY = 16
+
+# Performance 메트릭 정의 - statsSpecificResponses도 이 순서로 반환됨
+PERFORMANCE_METRICS: Tuple[str, ...] = (
+    "controller_num_iops",
+    "controller_avg_io_latency_usecs",
+    "controller_io_bandwidth_kBps",
+    "hypervisor_cpu_usage_ppm",
+    "hypervisor_memory_usage_ppm"
+)
+# 모든 메트릭을 쉼표로 연결하여 한 번에 요청
+PERFORMANCE_METRICS_PARAM = ','.join(PERFORMANCE_METRICS)
+
+async def fetch_stats(stats_url: str, params: httpx.QueryParams, auth: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """v1 stats API 호출 - 실패 응답이면 None 반환"""
+    client = app.state.http
+    request = client.build_request("GET", stats_url, params=params, timeout=30)
+    response = await client.send(request, auth=auth)
+
+    if response.is_error:
+        return None
+
+    return orjson.loads(response.content)
+
+# aggregationType -> NumPy 축소 함수 (그 외 값은 평균)
+STATS_REDUCERS = {"max": np.max, "min": np.min}
+
+# 엔티티 하나의 샘플 수가 이 값 이상이면 프로세스 풀에서 집계 (작은 응답은 전달 비용이 더 큼)
+STATS_OFFLOAD_MIN_SAMPLES = 100_000
+
+def count_stats_samples(stats_json: Dict[str, Any]) -> int:
+    """v1 stats 응답의 전체 샘플 수"""
+    return sum(len(r.get("values") or ()) for r in stats_json.get("statsSpecificResponses", []))
+
+def aggregate_stats(stats_json: Dict[str, Any], metrics: Tuple[str, ...], reducer: Callable) -> Dict[str, float]:
+    """v1 stats 응답을 메트릭별로 집계 (reducer: np.max / np.min / np.mean)
+
+    statsSpecificResponses는 요청한 metrics 순서대로 오며, 값이 없는 메트릭은 0으로 처리
+    """
+    stats_responses = stats_json.get("statsSpecificResponses", [])
+    values_lists = [r.get("values") or [0] for r in stats_responses[:len(metrics)]]
+    values_lists += [[0]] * (len(metrics) - len(values_lists))
+
+    if len({len(values) for values in values_lists}) == 1:
+        # 같은 기간/간격이면 샘플 수가 같으므로 2차원 배열로 한 번에 축소
+        arr = np.asarray(values_lists, dtype=np.float64)
+        agg = reducer(arr, axis=1)
+    else:
+        vals = [np.asarray(values, dtype=np.float64) for values in values_lists]
+        agg = np.fromiter(
+            (reducer(v) for v in vals),
+            dtype=np.float64,
+            count=len(metrics)
+        )
+    # None 등 숫자가 아닌 값은 NaN이 되므로 잘못된 응답으로 처리
+    if not np.isfinite(agg).all():
+        raise ValueError("stats values contain non-numeric samples")
+    return dict(zip(metrics, agg.tolist()))
+
+def performance_row_values(stats: Dict[str, float]) -> Dict[str, Any]:
+    """집계된 메트릭을 Performance 행 값으로 변환 (숫자 그대로 반환, 표시 형식은 프론트엔드/엑셀에서 처리)"""
+    return {
+        "iops": int(stats.get('controller_num_iops', 0)),
+        "latency": round(stats.get('controller_avg_io_latency_usecs', 0) / 1000, 2),  # usec -> ms
+        "bandwidth": round(stats.get('controller_io_bandwidth_kBps', 0) / 1024, 2),  # KB/s -> MB/s
+        "cpuUsage": round(stats.get('hypervisor_cpu_usage_ppm', 0) / 10000, 2),  # ppm -> %
+        "memoryUsage": round(stats.get('hypervisor_memory_usage_ppm', 0) / 10000, 2),  # ppm -> %
+    }
+
+def format_capacity(capacity_bytes: int) -> str:
+    """디스크 용량을 TB/GB/MB 단위 문자열로 변환 (소수 2자리, 끝의 0은 생략)"""
+    if capacity_bytes >= 1 << 40:
+        unit, divisor = "TB", 1 << 40
+    elif capacity_bytes >= 1 << 30:
+        unit, divisor = "GB", 1 << 30
+    else:
+        unit, divisor = "MB", 1 << 20
+    return f"{round(capacity_bytes / divisor, 2):g}{unit}"
+
+async def get_cluster_name(cluster: ClusterConfig) -> str:
+    """클러스터 이름 가져오기 (클러스터 ID별로 CACHE_TTL_MINUTES 동안 캐싱)"""
+    cached_name = _cluster_name_cache.get(cluster.id)
+    if cached_name is not None:
+        return cached_name
+
     url = get_api_url(cluster.ip, '/cluster')
     try:
-        json_data = nutanix_fetch(url, cluster)
-        return json_data.get("name", "Unknown")
+        json_data = await nutanix_fetch(url, cluster)
     except Exception:
+        # 조회 실패는 캐싱하지 않음
         return "Unknown"
 
+    cluster_name = json_data.get("name", "Unknown")
+    _cluster_name_cache[cluster.id] = cluster_name
+    return cluster_name
+
 # API 엔드포인트들
 @app.post("/api/verify-cluster")
 async def verify_cluster(cluster: ClusterConfig) -> dict:
     """클러스터 연결 검증 및 실제 클러스터 이름 반환"""
     url = get_api_url(cluster.ip, '/clusters')
     try:
-        nutanix_fetch(url, cluster, timeout_secs=10)
-        # 실제 클러스터 이름 가져오기
-        actual_cluster_name = get_cluster_name(cluster)
+        # 연결 검증과 실제 클러스터 이름 조회를 동시에 수행
+        _, actual_cluster_name = await asyncio.gather(
+            nutanix_fetch(url, cluster, timeout_secs=10),
+            get_cluster_name(cluster)
+        )
         return {"success": True, "clusterName": actual_cluster_name}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -201,14 +342,15 @@ async def cache_stats() -> dict:
     """캐시 통계 조회"""
     total_items = len(cache_storage)
     cache_info = []
+    now = time.monotonic()
     
-    for key, (data, timestamp) in cache_storage.items():
-        age_seconds = (datetime.now() - timestamp).total_seconds()
+    for key, (payload, timestamp) in cache_storage.items():
+        age_seconds = now - timestamp
         cache_info.append({
-            "key": key[:16] + "...",  # 키 일부만 표시
-            "items": len(data),
+            "key": "|".join(str(part) for part in key),
+            "bytes": len(payload),
             "age_seconds": int(age_seconds),
-            "expires_in": int(CACHE_TTL_MINUTES * 60 - age_seconds)
+            "expires_in": int(CACHE_TTL_SECS - age_seconds)
         })
     
     return {
@@ -230,8 +372,8 @@ async def fetch_data(
     cvmVcore: Optional[int] = 0,
     cvmMemory: Optional[int] = 0,
     ignoreCache: Optional[bool] = False
-) -> List[Dict[str, Any]]:
-    """데이터 조회 (캐싱 적용)"""
+) -> Response:
+    """데이터 조회 (캐싱 적용) - 캐시에는 직렬화된 JSON을 저장하여 그대로 응답"""
     
     # 캐시 키 생성
     cache_key = generate_cache_key(
@@ -249,106 +391,92 @@ async def fetch_data(
     
     # 캐시 확인 (ignoreCache가 False일 때만)
     if not ignoreCache:
-        cached_data = get_cached_data(cache_key)
-        if cached_data is not None:
-            return cached_data
+        cached_payload = get_cached_data(cache_key)
+        if cached_payload is not None:
+            return Response(content=cached_payload, media_type="application/json")
     else:
-        print(f"[CACHE IGNORED] Forcing API call for key: {cache_key}")
+        log.debug("[CACHE IGNORED] Forcing API call for key: %s", cache_key)
     
     # 캐시 미스 - API 호출하여 데이터 가져오기
     result = []
     
     if category == "VM":
-        # 클러스터 이름 가져오기
-        cluster_name = get_cluster_name(cluster)
+        # 클러스터 이름, 호스트 목록, VM 목록을 동시에 가져오기
+        # VM 목록 - include_vm_nic_config=true, include_vm_disk_config=true로 NIC 및 디스크 상세정보 포함
+        host_url = get_api_url(cluster.ip, '/hosts')
+        url = get_api_url(cluster.ip, '/vms?include_cvm=true&include_vm_nic_config=true&include_vm_disk_config=true')
+        cluster_name, host_data, json_data = await asyncio.gather(
+            get_cluster_name(cluster),
+            nutanix_fetch(host_url, cluster),
+            nutanix_fetch(url, cluster),
+            return_exceptions=True
+        )
+        if isinstance(json_data, Exception):
+            raise json_data
 
-        # 호스트 정보를 먼저 가져와서 host_uuid -> host_name 매핑 생성
+        # host_uuid -> host_name 매핑 생성
         host_name_map = {}
         try:
-            host_url = get_api_url(cluster.ip, '/hosts')
-            host_data = nutanix_fetch(host_url, cluster)
+            if isinstance(host_data, Exception):
+                raise host_data
             host_entities = host_data.get("entities", [])
             for host in host_entities:
                 host_uuid = host.get("uuid", "")
                 host_name = host.get("name", "Unknown")
                 if host_uuid:
                     host_name_map[host_uuid] = host_name
-            print(f"[DEBUG] Loaded {len(host_name_map)} hosts: {host_name_map}")
+            log.debug("Loaded %d hosts: %s", len(host_name_map), host_name_map)
         except Exception as e:
-            print(f"[ERROR] Failed to load host names: {e}")
+            log.error("Failed to load host names: %s", e)
 
-        # VM 목록 가져오기 - include_vm_nic_config=true, include_vm_disk_config=true로 NIC 및 디스크 상세정보 포함
-        url = get_api_url(cluster.ip, '/vms?include_cvm=true&include_vm_nic_config=true&include_vm_disk_config=true')
-        json_data = nutanix_fetch(url, cluster)
         entities = json_data.get("entities", [])
 
         result = []
+        append = result.append
+        get_host_name = host_name_map.get
         for vm in entities:
-            vm_uuid = vm.get("uuid", "")
-            vm_name = vm.get("vmName", "") or vm.get("name", "")
-            vm_power_state = vm.get("power_state", "UNKNOWN")
-            host_uuid = vm.get("host_uuid", "")
-            vm_nics = vm.get("vm_nics", [])
+            vm_get = vm.get
             
-            # NIC 정보 처리 - MAC과 IP를 분리해서 표시
-            mac_addresses = []
-            ip_addresses = []
-            for nic in vm_nics:
-                mac = nic.get("mac_address", "")
-                ip = nic.get("ip_address", "")
-                
-                if mac:
-                    mac_addresses.append(mac)
-                
-                # IP는 있으면 IP, 없으면 'none-ip-setting'
-                ip_display = ip if ip else "none-ip-setting"
-                if mac:  # MAC이 있는 경우에만 IP 추가
-                    ip_addresses.append(ip_display)
+            # NIC 정보 처리 - MAC이 있는 NIC만 (MAC, IP) 쌍으로 수집
+            # IP는 있으면 IP, 없으면 'none-ip-setting'
+            nic_pairs = [
+                (nic["mac_address"], nic.get("ip_address") or "none-ip-setting")
+                for nic in vm_get("vm_nics", [])
+                if nic.get("mac_address")
+            ]
             
             # 개행으로 구분하여 표시
-            mac_str = "\n".join(mac_addresses) if mac_addresses else ""
-            ip_str = "\n".join(ip_addresses) if ip_addresses else ""
+            mac_str = "\n".join([mac for mac, _ in nic_pairs])
+            ip_str = "\n".join([ip for _, ip in nic_pairs])
             
-            # vDisk 정보 처리
-            vm_disks = vm.get("vm_disk_info", [])
-            disk_list = []
-            for disk in vm_disks:
-                disk_label = disk.get("disk_address", {}).get("disk_label", "N/A")
-                size_bytes = disk.get("size", 0)
-                # Byte를 GiB로 변환
-                size_gib = size_bytes / (1024**3) if size_bytes else 0
-                disk_str = f"{disk_label} : {size_gib:.0f} GiB"
-                disk_list.append(disk_str)
-            
-            vdisk_str = "\n".join(disk_list) if disk_list else ""
+            # vDisk 정보 처리 - Byte를 GiB로 변환 (정수 시프트, 반올림)
+            vdisk_str = "\n".join([
+                f"{disk.get('disk_address', {}).get('disk_label', 'N/A')} : {((disk.get('size') or 0) + (1 << 29)) >> 30} GiB"
+                for disk in vm_get("vm_disk_info", [])
+            ])
             
             # vCore 계산: num_vcpus * num_cores_per_vcpu
-            num_vcpus = vm.get("num_vcpus", 0)
-            num_cores_per_vcpu = vm.get("num_cores_per_vcpu", 1)
-            total_vcores = num_vcpus * num_cores_per_vcpu
-            memory_mb = vm.get("memory_mb", 0)
-            # MB를 GiB로 변환
-            memory_gib = int(memory_mb / 1024) if memory_mb else 0
+            total_vcores = vm_get("num_vcpus", 0) * vm_get("num_cores_per_vcpu", 1)
+            memory_mb = vm_get("memory_mb", 0)
             
-            # 호스트 이름 매핑에서 가져오기
-            host_name = host_name_map.get(host_uuid, "N/A")
-
-            result.append({
+            append({
                 "clusterName": cluster_name,
-                "hostName": host_name,
-                "name": vm_name,
-                "uuid": vm_uuid,
-                "powerState": vm_power_state,
+                "hostName": get_host_name(vm_get("host_uuid", ""), "N/A"),
+                "name": vm_get("vmName", "") or vm_get("name", ""),
+                "uuid": vm_get("uuid", ""),
+                "powerState": vm_get("power_state", "UNKNOWN"),
                 "macAddress": mac_str,
                 "ipAddresses": ip_str,
                 "vDisk": vdisk_str,
                 "numVcpus": total_vcores,
-                "memoryGib": memory_gib,
+                # MB를 GiB로 변환
+                "memoryGib": int(memory_mb / 1024) if memory_mb else 0,
             })
 
         # 캐시 저장
-        set_cached_data(cache_key, result)
-        return result
+        payload = orjson.dumps(result)
+        set_cached_data(cache_key, payload)
+        return Response(content=payload, media_type="application/json")
 
     elif category == "Performance":
         # Performance 데이터 가져오기
@@ -364,16 +492,16 @@ async def fetch_data(
         except ValueError as e:
             raise HTTPException(status_code=400, detail=f"Invalid datetime format: {e}")
         
-        # 클러스터 정보 가져오기
+        # 클러스터 정보와 호스트 목록을 동시에 가져오기
         cluster_url = get_api_url(cluster.ip, '/clusters')
-        cluster_data = nutanix_fetch(cluster_url, cluster)
+        host_url = get_api_url(cluster.ip, '/hosts')
+        cluster_data, host_data = await asyncio.gather(
+            nutanix_fetch(cluster_url, cluster),
+            nutanix_fetch(host_url, cluster)
+        )
         cluster_entity = cluster_data.get("entities", [{}])[0]
         cluster_id = cluster_entity.get("uuid", "")
         cluster_name = cluster_entity.get("name", "Unknown")
-        
-        # 호스트 목록 가져오기
-        host_url = get_api_url(cluster.ip, '/hosts')
-        host_data = nutanix_fetch(host_url, cluster)
         host_entities = host_data.get("entities", [])
         
         result = []
@@ -381,192 +509,120 @@ async def fetch_data(
         # v1 API 사용 (첨부 파일 참고)
         base_stats_url = f"https://{cluster.ip}:9440/PrismGateway/services/rest/v1"
         
-        # 메트릭 정의
-        metrics = [
-            "controller_num_iops",
-            "controller_avg_io_latency_usecs", 
-            "controller_io_bandwidth_kBps",
-            "hypervisor_cpu_usage_ppm",
-            "hypervisor_memory_usage_ppm"
-        ]
+        metrics = PERFORMANCE_METRICS
+        # 집계 함수는 요청 단위로 한 번만 선택
+        reducer = STATS_REDUCERS.get(aggregationType, np.mean)
         
-        # 클러스터 통계 가져오기 - 모든 메트릭을 한 번에 요청
-        cluster_stats = {}
-        try:
-            # 모든 메트릭을 쉼표로 연결하여 한 번에 요청
-            metrics_str = ','.join(metrics)
-            params = {
-                'metrics': metrics_str,
-                'startTimeInUsecs': start_usec,
-                'endTimeInUsecs': end_usec,
-                'intervalInSecs': interval
-            }
-            
-            stats_url = f"{base_stats_url}/clusters/{cluster_id}/stats/"
-            response = requests.get(
-                stats_url,
-                params=params,
-                auth=(cluster.username, cluster.password),
-                verify=False,
-                timeout=30
-            )
-            
-            if response.ok:
-                stats_data = response.json()
-                stats_responses = stats_data.get("statsSpecificResponses", [])
-                
-                # 각 메트릭별로 응답 처리
-                for i, metric in enumerate(metrics):
-                    if i < len(stats_responses):
-                        values = stats_responses[i].get("values", [])
-                        
-                        if values:
-                            if aggregationType == "max":
-                                cluster_stats[metric] = max(values)
-                            elif aggregationType == "min":
-                                cluster_stats[metric] = min(values)
-                            else:  # average
-                                cluster_stats[metric] = sum(values) / len(values)
-                        else:
-                            cluster_stats[metric] = 0
-                    else:
-                        cluster_stats[metric] = 0
+        # 모든 통계 요청이 같은 params 객체를 공유 (httpx는 params를 변경하지 않음)
+        # 쿼리 문자열과 인증 정보는 모든 엔티티가 공유하므로 한 번만 구성
+        params = httpx.QueryParams({
+            'metrics': PERFORMANCE_METRICS_PARAM,
+            'startTimeInUsecs': start_usec,
+            'endTimeInUsecs': end_usec,
+            'intervalInSecs': interval
+        })
+        auth = (cluster.username, cluster.password)
+        
+        # 클러스터 + 각 호스트의 통계를 동시에 요청 (최대 STATS_FETCH_CONCURRENCY개씩)
+        stats_semaphore = asyncio.Semaphore(STATS_FETCH_CONCURRENCY)
+        
+        async def fetch_stats_limited(stats_url: str) -> Optional[Dict[str, Any]]:
+            async with stats_semaphore:
+                return await fetch_stats(stats_url, params, auth)
+        
+        stats_urls = [f"{base_stats_url}/clusters/{cluster_id}/stats/"]
+        stats_urls += [f"{base_stats_url}/hosts/{host.get('uuid', '')}/stats/" for host in host_entities]
+        responses = await asyncio.gather(
+            *(fetch_stats_limited(stats_url) for stats_url in stats_urls),
+            return_exceptions=True
+        )
+        
+        loop = asyncio.get_running_loop()
+        entity_stats = []
+        offloaded = {}  # entity_idx -> 프로세스 풀 집계 future
+        
+        def stats_error(entity_idx: int, error: BaseException) -> Dict[str, float]:
+            """엔티티별 조회/집계 에러 로그 - 에러 시 모든 메트릭을 0으로 설정"""
+            if entity_idx == 0:
+                log.warning("Error fetching cluster stats: %s", error)
             else:
+                log.warning("Error fetching stats for host %s: %s", host_entities[entity_idx - 1].get('name', 'Unknown'), error)
+            return dict.fromkeys(metrics, 0)
+        
+        for entity_idx, stats_data in enumerate(responses):
+            if isinstance(stats_data, Exception):
+                entity_stats.append(stats_error(entity_idx, stats_data))
+            elif stats_data is None:
                 # 실패 시 모든 메트릭을 0으로 설정
-                for metric in metrics:
-                    cluster_stats[metric] = 0
-        except Exception as e:
-            print(f"Error fetching cluster stats: {e}")
-            # 에러 시 모든 메트릭을 0으로 설정
-            for metric in metrics:
-                cluster_stats[metric] = 0
+                entity_stats.append(dict.fromkeys(metrics, 0))
+            else:
+                # 잘못된 응답 하나가 전체 요청을 실패시키지 않도록 엔티티별로 처리
+                try:
+                    if count_stats_samples(stats_data) >= STATS_OFFLOAD_MIN_SAMPLES:
+                        offloaded[entity_idx] = loop.run_in_executor(app.state.pool, aggregate_stats, stats_data, metrics, reducer)
+                        entity_stats.append(None)
+                    else:
+                        entity_stats.append(aggregate_stats(stats_data, metrics, reducer))
+                except Exception as e:
+                    entity_stats.append(stats_error(entity_idx, e))
+        
+        if offloaded:
+            for entity_idx, agg in zip(offloaded, await asyncio.gather(*offloaded.values(), return_exceptions=True)):
+                entity_stats[entity_idx] = stats_error(entity_idx, agg) if isinstance(agg, Exception) else agg
         
         # 클러스터 행 추가
-        cluster_row = {
+        result.append({
             "entityType": "cluster",
             "entityName": cluster_name,
-            "iops": f"{int(cluster_stats.get('controller_num_iops', 0)):,}",
-            "latency": f"{cluster_stats.get('controller_avg_io_latency_usecs', 0) / 1000:.2f}",  # usec -> ms
-            "bandwidth": f"{cluster_stats.get('controller_io_bandwidth_kBps', 0) / 1024:.2f} MB/s",  # KB/s -> MB/s
-            "cpuUsage": f"{cluster_stats.get('hypervisor_cpu_usage_ppm', 0) / 10000:.2f}",  # ppm -> %
-            "memoryUsage": f"{cluster_stats.get('hypervisor_memory_usage_ppm', 0) / 10000:.2f}",  # ppm -> %
-        }
-        result.append(cluster_row)
-        
-        # 각 호스트의 통계 가져오기 - 모든 메트릭을 한 번에 요청
-        for host in host_entities:
-            host_id = host.get("uuid", "")
-            host_name = host.get("name", "Unknown")
-            
-            host_stats = {}
-            try:
-                # 모든 메트릭을 쉼표로 연결하여 한 번에 요청
-                metrics_str = ','.join(metrics)
-                params = {
-                    'metrics': metrics_str,
-                    'startTimeInUsecs': start_usec,
-                    'endTimeInUsecs': end_usec,
-                    'intervalInSecs': interval
-                }
-                
-                stats_url = f"{base_stats_url}/hosts/{host_id}/stats/"
-                response = requests.get(
-                    stats_url,
-                    params=params,
-                    auth=(cluster.username, cluster.password),
-                    verify=False,
-                    timeout=30
-                )
-                
-                if response.ok:
-                    stats_data = response.json()
-                    stats_responses = stats_data.get("statsSpecificResponses", [])
-                    
-                    # 각 메트릭별로 응답 처리
-                    for i, metric in enumerate(metrics):
-                        if i < len(stats_responses):
-                            values = stats_responses[i].get("values", [])
-                            
-                            if values:
-                                if aggregationType == "max":
-                                    host_stats[metric] = max(values)
-                                elif aggregationType == "min":
-                                    host_stats[metric] = min(values)
-                                else:  # average
-                                    host_stats[metric] = sum(values) / len(values)
-                            else:
-                                host_stats[metric] = 0
-                        else:
-                            host_stats[metric] = 0
-                else:
-                    # 실패 시 모든 메트릭을 0으로 설정
-                    for metric in metrics:
-                        host_stats[metric] = 0
-            except Exception as e:
-                print(f"Error fetching stats for host {host_name}: {e}")
-                # 에러 시 모든 메트릭을 0으로 설정
-                for metric in metrics:
-                    host_stats[metric] = 0
-            
-            # 호스트 행 추가
-            host_row = {
+            **performance_row_values(entity_stats[0]),
+        })
+        
+        # 호스트 행 추가
+        for host, host_stats in zip(host_entities, entity_stats[1:]):
+            result.append({
                 "entityType": "host",
-                "entityName": host_name,
+                "entityName": host.get("name", "Unknown"),
                 "parentCluster": cluster_name,
-                "iops": f"{int(host_stats.get('controller_num_iops', 0)):,}",
-                "latency": f"{host_stats.get('controller_avg_io_latency_usecs', 0) / 1000:.2f}",
-                "bandwidth": f"{host_stats.get('controller_io_bandwidth_kBps', 0) / 1024:.2f} MB/s",
-                "cpuUsage": f"{host_stats.get('hypervisor_cpu_usage_ppm', 0) / 10000:.2f}",
-                "memoryUsage": f"{host_stats.get('hypervisor_memory_usage_ppm', 0) / 10000:.2f}",
-            }
-            result.append(host_row)
+                **performance_row_values(host_stats),
+            })
         
         # 캐시 저장
-        set_cached_data(cache_key, result)
-        return result
+        payload = orjson.dumps(result)
+        set_cached_data(cache_key, payload)
+        return Response(content=payload, media_type="application/json")
 
     # 다른 카테고리는 간단히 구현
     elif category == "Hardware":
-        # 호스트 정보 가져오기
+        # 호스트 정보와 디스크 정보를 동시에 가져오기
         url = get_api_url(cluster.ip, '/hosts')
-        json_data = nutanix_fetch(url, cluster)
+        disk_url = get_api_url(cluster.ip, '/disks')
+        json_data, disk_data = await asyncio.gather(
+            nutanix_fetch(url, cluster),
+            nutanix_fetch(disk_url, cluster),
+            return_exceptions=True
+        )
+        if isinstance(json_data, Exception):
+            raise json_data
         entities = json_data.get("entities", [])
         
         # 노드 UUID별 디스크 정보 맵 생성 (개별 디스크 목록)
-        disk_info_map = {}
-        disk_model_map = {}
+        disk_info_map = defaultdict(list)
+        disk_model_map = defaultdict(list)
         try:
-            # 디스크 정보 가져오기
-            disk_url = get_api_url(cluster.ip, '/disks')
-            disk_data = nutanix_fetch(disk_url, cluster)
+            if isinstance(disk_data, Exception):
+                raise disk_data
             disk_entities = disk_data.get("entities", [])
             
             # 노드 UUID별로 디스크 정보 수집 (각 디스크를 개별적으로 저장)
             for disk in disk_entities:
                 node_uuid = disk.get("node_uuid", "")
                 if node_uuid:
-                    if node_uuid not in disk_info_map:
-                        disk_info_map[node_uuid] = []
-                        disk_model_map[node_uuid] = []
-                    
                     # 디스크 타입과 용량
                     disk_type = disk.get("storage_tier_name", "UNKNOWN")
-                    capacity_bytes = disk.get("disk_size", 0)
-                    
-                    # 용량을 TB, GB, MB로 변환
-                    if capacity_bytes >= 1024**4:
-                        capacity_str = f"{capacity_bytes / (1024**4):.2f}TB".rstrip('0').rstrip('.')
-                    elif capacity_bytes >= 1024**3:
-                        capacity_str = f"{capacity_bytes / (1024**3):.2f}GB".rstrip('0').rstrip('.')
-                    else:
-                        capacity_str = f"{capacity_bytes / (1024**2):.2f}MB".rstrip('0').rstrip('.')
-                    
-                    disk_str = f"{capacity_str} {disk_type}"
-                    disk_info_map[node_uuid].append(disk_str)
+                    disk_info_map[node_uuid].append(f"{format_capacity(disk.get('disk_size', 0))} {disk_type}")
                     
                     # 디스크 모델 정보
-                    disk_model = disk.get("disk_hardware_config", {}).get("model", "N/A")
-                    disk_model_map[node_uuid].append(disk_model)
+                    disk_model_map[node_uuid].append(disk.get("disk_hardware_config", {}).get("model", "N/A"))
         except Exception:
             # 디스크 정보를 가져올 수 없으면 무시
             pass
@@ -576,11 +632,8 @@ async def fetch_data(
             host_uuid = host.get("uuid", "")
             
             # 디스크 정보 포맷팅 (각 디스크를 개별 라인으로)
-            disk_str = ""
-            disk_model_str = ""
-            if host_uuid in disk_info_map:
-                disk_str = "\n".join(disk_info_map[host_uuid])
-                disk_model_str = "\n".join(disk_model_map[host_uuid])
+            disk_str = "\n".join(disk_info_map.get(host_uuid, ()))
+            disk_model_str = "\n".join(disk_model_map.get(host_uuid, ()))
             
             result.append({
                 "hostName": host.get("name", "Unknown"),
@@ -595,73 +648,83 @@ async def fetch_data(
             })
         
         # 캐시 저장
-        set_cached_data(cache_key, result)
-        return result
+        payload = orjson.dumps(result)
+        set_cached_data(cache_key, payload)
+        return Response(content=payload, media_type="application/json")
     
     elif category == "Resources":
         # Resources 카테고리 - CPU 및 Memory 분석
         
-        # 호스트 정보 가져오기
+        # 호스트 정보와 VM 목록을 동시에 가져오기
         host_url = get_api_url(cluster.ip, '/hosts')
-        host_data = nutanix_fetch(host_url, cluster)
-        host_entities = host_data.get("entities", [])
-        
-        # VM 목록 가져오기
         vm_url = get_api_url(cluster.ip, '/vms?include_cvm=true')
-        vm_data = nutanix_fetch(vm_url, cluster)
+        host_data, vm_data = await asyncio.gather(
+            nutanix_fetch(host_url, cluster),
+            nutanix_fetch(vm_url, cluster)
+        )
+        host_entities = host_data.get("entities", [])
         vm_entities = vm_data.get("entities", [])
         
-        # 호스트별 VM 정보 집계
-        host_vm_map = {}
-        for vm in vm_entities:
-            host_uuid = vm.get("host_uuid", "")
-            if not host_uuid:
-                continue
-            
-            if host_uuid not in host_vm_map:
-                host_vm_map[host_uuid] = {
-                    "vms": [],
-                    "powered_on_vms": []
-                }
-            
-            host_vm_map[host_uuid]["vms"].append(vm)
-            if vm.get("power_state") == "on":
-                host_vm_map[host_uuid]["powered_on_vms"].append(vm)
+        # 호스트 UUID -> 호스트 행 인덱스 (UUID가 없는 VM/호스트는 집계 제외)
+        host_count = len(host_entities)
+        host_index = {host.get("uuid", ""): idx for idx, host in enumerate(host_entities)}
+        host_index.pop("", None)
+        
+        # 호스트별 물리 자원
+        pcores = [host.get("num_cpu_cores", 0) for host in host_entities]
+        memory_capacities_gib = [
+            int(host.get("memory_capacity_in_bytes", 0) / (1024**3)) if host.get("memory_capacity_in_bytes") else 0
+            for host in host_entities
+        ]
+        
+        # VM 정보를 열 단위 배열로 변환
+        vm_count_all = len(vm_entities)
+        vm_host = np.fromiter((host_index.get(vm.get("host_uuid", ""), -1) for vm in vm_entities), dtype=np.int64, count=vm_count_all)
+        # vCore = num_vcpus * num_cores_per_vcpu
+        vm_vcores = np.fromiter((vm.get("num_vcpus", 0) * vm.get("num_cores_per_vcpu", 1) for vm in vm_entities), dtype=np.int64, count=vm_count_all)
+        vm_memory_gib = np.fromiter((vm.get("memory_mb", 0) for vm in vm_entities), dtype=np.float64, count=vm_count_all) / 1024
+        vm_powered_on = np.fromiter((vm.get("power_state") == "on" for vm in vm_entities), dtype=bool, count=vm_count_all)
+        
+        # 호스트별 집계 - 전체 VM 수는 모든 VM, 자원 사용량은 전원이 켜진 VM 기준
+        assigned = vm_host >= 0
+        on_mask = assigned & vm_powered_on
+        on_host = vm_host[on_mask]
+        on_vcores = vm_vcores[on_mask]
+        on_memory_gib = vm_memory_gib[on_mask]
+        
+        vm_counts = np.bincount(vm_host[assigned], minlength=host_count)
+        use_vcores_per_host = np.bincount(on_host, weights=on_vcores, minlength=host_count).astype(np.int64)
+        use_memory_per_host = np.bincount(on_host, weights=on_memory_gib, minlength=host_count)
+        # NUMA over: vCore > pCore/2, Memory > 물리서버 Memory/2
+        numa_over_cpu_per_host = np.bincount(
+            on_host[on_vcores > np.asarray(pcores, dtype=np.float64)[on_host] / 2],
+            minlength=host_count
+        )
+        numa_over_memory_per_host = np.bincount(
+            on_host[on_memory_gib > np.asarray(memory_capacities_gib, dtype=np.float64)[on_host] / 2],
+            minlength=host_count
+        )
         
         # CPU 테이블 데이터 생성
         cpu_rows = []
         memory_rows = []
         
-        for host in host_entities:
-            host_uuid = host.get("uuid", "")
+        for host, num_cores, memory_capacity_gib, vm_count, use_vcores, numa_over_cpu, use_memory_gib, numa_over_memory in zip(
+            host_entities,
+            pcores,
+            memory_capacities_gib,
+            vm_counts.tolist(),
+            use_vcores_per_host.tolist(),
+            numa_over_cpu_per_host.tolist(),
+            use_memory_per_host.tolist(),
+            numa_over_memory_per_host.tolist()
+        ):
             host_name = host.get("name", "Unknown")
-            num_cores = host.get("num_cpu_cores", 0)
-            memory_capacity_bytes = host.get("memory_capacity_in_bytes", 0)
-            memory_capacity_gib = int(memory_capacity_bytes / (1024**3)) if memory_capacity_bytes else 0
-            
-            vms = host_vm_map.get(host_uuid, {}).get("vms", [])
-            powered_on_vms = host_vm_map.get(host_uuid, {}).get("powered_on_vms", [])
-            
-            vm_count = len(vms)
-            
-            # CPU 계산
-            numa_over_cpu = 0
-            use_vcores = 0
-            for vm in powered_on_vms:
-                # vCore = num_vcpus * num_cores_per_vcpu
-                num_vcpus = vm.get("num_vcpus", 0)
-                num_cores_per_vcpu = vm.get("num_cores_per_vcpu", 1)
-                vcpus = num_vcpus * num_cores_per_vcpu
-                use_vcores += vcpus
-                # NUMA over: vCore > pCore/2
-                if vcpus > (num_cores / 2):
-                    numa_over_cpu += 1
             
             # CVM vCore 추가
             use_vcores += cvmVcore if cvmVcore else 0
             
-            recommend_vcore_ratio = f"1:{ratio}"
-            current_vcore_ratio = f"1:{use_vcores / num_cores:.1f}" if num_cores > 0 else "1:0.0"
+            # vCore 비율은 1:N의 N 값만 숫자로 반환
             current_vcore_ratio_value = use_vcores / num_cores if num_cores > 0 else 0
             
             cpu_result = "PASS" if current_vcore_ratio_value <= ratio else "FAIL"
@@ -673,22 +736,11 @@ async def fetch_data(
                 "numaOver": numa_over_cpu,
                 "pCore": num_cores,
                 "useVCore": use_vcores,
-                "recommendVcoreRatio": recommend_vcore_ratio,
-                "currentVcoreRatio": current_vcore_ratio,
+                "recommendVcoreRatio": ratio,
+                "currentVcoreRatio": current_vcore_ratio_value,
                 "result": cpu_result
             })
             
-            # Memory 계산
-            numa_over_memory = 0
-            use_memory_gib = 0
-            for vm in powered_on_vms:
-                memory_mb = vm.get("memory_mb", 0)
-                memory_gib = memory_mb / 1024
-                use_memory_gib += memory_gib
-                # NUMA over: Memory > 물리서버 Memory/2
-                if memory_gib > (memory_capacity_gib / 2):
-                    numa_over_memory += 1
-            
             # CVM Memory 추가
             use_memory_gib += cvmMemory if cvmMemory else 0
             
@@ -719,8 +771,8 @@ async def fetch_data(
             "numaOver": total_numa_over_cpu,
             "pCore": total_pcore,
             "useVCore": total_use_vcore,
-            "recommendVcoreRatio": f"1:{ratio}",
-            "currentVcoreRatio": f"1:{avg_current_vcore_ratio:.2f}",
+            "recommendVcoreRatio": ratio,
+            "currentVcoreRatio": avg_current_vcore_ratio,
             "result": total_cpu_result
         })
         
@@ -767,203 +819,451 @@ async def fetch_data(
         result = cpu_rows + memory_rows
         
         # 캐시 저장
-        set_cached_data(cache_key, result)
-        return result
+        payload = orjson.dumps(result)
+        set_cached_data(cache_key, payload)
+        return Response(content=payload, media_type="application/json")
 
     else:
-        return []
+        return Response(content=b"[]", media_type="application/json")
 
-@app.post("/api/export-xlsx")
-async def export_xlsx(request_data: dict):
-    """엑셀 형식으로 데이터 내보내기"""
-    try:
-        is_resources = request_data.get("isResources", False)
-        filename = request_data.get("filename", "export")
+# 엑셀 내보내기 스타일 - 요청마다 다시 만들지 않도록 모듈 로드 시 한 번만 생성
+# 스타일 객체는 불변이므로 여러 셀/테두리에서 공유해도 안전
+THIN_SIDE = Side(style='thin')
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+# 중앙 정렬 (수평 + 수직)
+CENTER_ALIGN = Alignment(
+    horizontal='center',
+    vertical='center',
+    wrap_text=True
+)
+# 색상은 8자리 ARGB - 6자리로 지정하면 알파가 00(투명)으로 채워짐
+HEADER_FILL = PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFFFF", size=10)
+DATA_FONT = Font(size=10)
 
-        # 워크북 생성
-        wb = Workbook()
-        
-        # Resources 특별 처리
-        if is_resources:
-            cpu_data = request_data.get("cpuData", [])
-            memory_data = request_data.get("memoryData", [])
-            cpu_fields = request_data.get("cpuFields", [])
-            memory_fields = request_data.get("memoryFields", [])
-            cpu_field_labels = request_data.get("cpuFieldLabels", {})
-            memory_field_labels = request_data.get("memoryFieldLabels", {})
-            
-            # 테두리 및 정렬 스타일
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            center_alignment = Alignment(
-                horizontal='center',
-                vertical='center',
-                wrap_text=True
-            )
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=10)
-            data_font = Font(size=10)
-            
-            # CPU 시트
-            ws_cpu = wb.active
-            ws_cpu.title = "CPU"
-            
-            # CPU 헤더
-            for col_idx, field in enumerate(cpu_fields, 1):
-                cell = ws_cpu.cell(row=1, column=col_idx)
-                cell.value = cpu_field_labels.get(field, field)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = center_alignment
-                cell.border = thin_border
-            
-            # CPU 데이터
-            for row_idx, row in enumerate(cpu_data, 2):
-                for col_idx, field in enumerate(cpu_fields, 1):
-                    cell = ws_cpu.cell(row=row_idx, column=col_idx)
-                    cell.value = row.get(field, "")
-                    cell.number_format = '@'
-                    cell.alignment = center_alignment
-                    cell.border = thin_border
-                    cell.font = data_font
-            
-            # CPU 열 너비 조정
-            for col_idx in range(1, len(cpu_fields) + 1):
-                column_letter = chr(64 + col_idx)
-                ws_cpu.column_dimensions[column_letter].width = 20
-            
-            # Memory 시트
-            ws_memory = wb.create_sheet(title="Memory")
-            
-            # Memory 헤더
-            for col_idx, field in enumerate(memory_fields, 1):
-                cell = ws_memory.cell(row=1, column=col_idx)
-                cell.value = memory_field_labels.get(field, field)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = center_alignment
-                cell.border = thin_border
-            
-            # Memory 데이터
-            for row_idx, row in enumerate(memory_data, 2):
-                for col_idx, field in enumerate(memory_fields, 1):
-                    cell = ws_memory.cell(row=row_idx, column=col_idx)
-                    cell.value = row.get(field, "")
-                    cell.number_format = '@'
-                    cell.alignment = center_alignment
-                    cell.border = thin_border
-                    cell.font = data_font
-            
-            # Memory 열 너비 조정
-            for col_idx in range(1, len(memory_fields) + 1):
-                column_letter = chr(64 + col_idx)
-                ws_memory.column_dimensions[column_letter].width = 20
-        
-        else:
-            # 기존 로직 (VM, Hardware, Performance)
-            data = request_data.get("data", [])
-            fields = request_data.get("fields", [])
-            field_labels = request_data.get("fieldLabels", {})
-            
-            ws = wb.active
-            ws.title = "Data"
-
-            # 테두리 스타일 정의
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            # 중앙 정렬 (수평 + 수직)
-            center_alignment = Alignment(
-                horizontal='center',
-                vertical='center',
-                wrap_text=True
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 엑셀 파일(zip) 압축 수준 - 기본값(6) 대비 파일은 조금 커지지만 압축 CPU 시간이 크게 줄어듦
+EXPORT_ZIP_COMPRESSLEVEL = 1
+
+def attachment_headers(filename: str) -> Dict[str, str]:
+    """다운로드 파일명 헤더 - 한글 등 비 ASCII 파일명은 RFC 5987 형식으로 인코딩"""
+    quoted = quote(filename)
+    if quoted != filename:
+        return {"Content-Disposition": f"attachment; filename*=utf-8''{quoted}"}
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+def get_number_format(value: Any, field_format: Optional[str] = None) -> str:
+    """셀 값에 맞는 엑셀 표시 형식 - 숫자는 숫자 형식(필드별 지정 우선), 나머지는 텍스트"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return '@'
+    if field_format:
+        return field_format
+    return '#,##0' if isinstance(value, int) else '#,##0.00'
+
+def column_number_formats(field_format: Optional[str] = None) -> Dict[type, str]:
+    """열 하나의 값 타입별 표시 형식 - 셀마다 get_number_format을 호출하지 않도록 열 단위로 미리 계산
+
+    JSON 값 타입(str/int/float/bool/None)만 포함하며, 그 외 타입은 숫자가 아니므로 텍스트('@')로 처리
+    """
+    return {type(sample): get_number_format(sample, field_format) for sample in ("", 0, 0.0, False, None)}
+
+def add_export_styles(wb: Workbook, field_formats: Dict[str, str]) -> Dict[str, str]:
+    """워크북에 헤더/데이터 NamedStyle 등록 - {표시 형식: 데이터 스타일 이름} 반환
+
+    NamedStyle은 등록된 워크북에 묶이므로 동시 요청 간에 공유하지 않고 워크북마다 새로 생성
+    """
+    wb.add_named_style(NamedStyle(name="header", font=HEADER_FONT, fill=HEADER_FILL, alignment=CENTER_ALIGN, border=THIN_BORDER))
+    style_names = {}
+    number_formats = dict.fromkeys(('@', '#,##0', '#,##0.00', *field_formats.values()))
+    for idx, number_format in enumerate(number_formats):
+        name = "data" if number_format == '@' else f"data {idx}"
+        wb.add_named_style(NamedStyle(name=name, font=DATA_FONT, alignment=CENTER_ALIGN, border=THIN_BORDER, number_format=number_format))
+        style_names[number_format] = name
+    return style_names
+
+def header_cell(ws, label: str) -> WriteOnlyCell:
+    """헤더 셀 생성"""
+    cell = WriteOnlyCell(ws, value=label)
+    cell.style = "header"
+    return cell
+
+def data_cell(ws, value: Any, style_name: str) -> WriteOnlyCell:
+    """데이터 셀 생성 - 숫자는 숫자 형식, 나머지 셀은 텍스트 형식 스타일 적용"""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style_name
+    return cell
+
+def export_sheet_specs(request_data: Dict[str, Any]) -> List[Tuple[str, List[str], Dict[str, str], List[Dict[str, Any]], bool]]:
+    """내보내기 요청을 시트 목록으로 변환 - (시트 이름, 필드, 필드 라벨, 행, 첫 행 필터 여부)"""
+    # Resources는 CPU/Memory 시트로 분리
+    if request_data.get("isResources", False):
+        return [
+            ("CPU", request_data.get("cpuFields", []), request_data.get("cpuFieldLabels", {}), request_data.get("cpuData", []), False),
+            ("Memory", request_data.get("memoryFields", []), request_data.get("memoryFieldLabels", {}), request_data.get("memoryData", []), False),
+        ]
+    # 기존 로직 (VM, Hardware, Performance)
+    return [("Data", request_data.get("fields", []), request_data.get("fieldLabels", {}), request_data.get("data", []), True)]
+
+def write_sheet(
+    wb: Workbook,
+    title: str,
+    fields: List[str],
+    labels: Dict[str, str],
+    rows: List[Dict[str, Any]],
+    auto_filter: bool,
+    field_formats: Dict[str, str],
+    style_names: Dict[str, str]
+) -> None:
+    """쓰기 전용 워크북에 시트를 만들고 헤더와 데이터 행 기록"""
+    ws = wb.create_sheet(title=title)
+
+    # 열 문자(A, B, ...)는 시트마다 한 번만 계산
+    letters = tuple(get_column_letter(col_idx) for col_idx in range(1, len(fields) + 1))
+
+    # 열 너비 조정 - 쓰기 전용 시트는 첫 행 기록 전에 지정해야 함
+    for letter in letters:
+        ws.column_dimensions[letter].width = 20
+
+    # 첫 행에 필터 설정
+    if auto_filter and letters:
+        ws.auto_filter.ref = f"A1:{letters[-1]}1"
+
+    # 헤더 행
+    ws.append([header_cell(ws, labels.get(field, field)) for field in fields])
+
+    # 데이터 행 - 필드별 표시 형식은 시트마다 한 번만 조회
+    # 데이터 셀 스타일은 열마다 값 타입별로 한 번만 결정
+    column_styles = [
+        {value_type: style_names[number_format] for value_type, number_format in column_number_formats(field_formats.get(field)).items()}
+        for field in fields
+    ]
+    text_style = style_names['@']
+    # map(row.get, fields, defaults) == [row.get(field, "") for field in fields] - 열 순회를 C 레벨에서 처리
+    defaults = ("",) * len(fields)
+    append = ws.append
+    for row in rows:
+        append([
+            data_cell(ws, value, styles.get(type(value), text_style))
+            for value, styles in zip(map(row.get, fields, defaults), column_styles)
+        ])
+
+# ============ 대용량 내보내기 (XML 직접 생성) ============
+# 행 수가 이 값을 넘는 단일 시트 내보내기는 openpyxl 대신 시트 XML을 직접 생성
+FAST_XLSX_MIN_ROWS = 10_000
+
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+XLSX_CONTENT_TYPES_XML = XML_DECLARATION + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS_XML = XML_DECLARATION + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK_RELS_XML = XML_DECLARATION + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# 정렬/테두리는 헤더·데이터 스타일 공통 (CENTER_ALIGN, THIN_BORDER와 동일)
+XLSX_XF_ALIGNMENT = '<alignment horizontal="center" vertical="center" wrapText="1"/>'
+
+def _fast_xlsx_workbook(title: str, last_col: Optional[str]) -> str:
+    """workbook.xml - 필터가 있으면 _FilterDatabase 이름 정의 포함 (openpyxl과 동일)"""
+    defined_names = ""
+    if last_col:
+        defined_names = (
+            '<definedNames><definedName name="_xlnm._FilterDatabase" localSheetId="0" hidden="1">'
+            f"'{title}'!$A$1:${last_col}$1</definedName></definedNames>"
+        )
+    return XML_DECLARATION + (
+        f'<workbook xmlns="{SPREADSHEET_NS}" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>{defined_names}</workbook>'
+    )
+
+def _fast_xlsx_styles(number_formats: List[str]) -> str:
+    """styles.xml - cellXfs는 0: 기본, 1: 헤더, 2부터 number_formats 순서의 데이터 스타일"""
+    custom_formats = []
+    data_xfs = []
+    for number_format in number_formats:
+        num_fmt_id = BUILTIN_FORMATS_REVERSE.get(number_format)
+        if num_fmt_id is None:
+            num_fmt_id = 164 + len(custom_formats)
+            custom_formats.append(f'<numFmt numFmtId="{num_fmt_id}" formatCode={quoteattr(number_format)}/>')
+        data_xfs.append(
+            f'<xf numFmtId="{num_fmt_id}" fontId="2" fillId="0" borderId="1" xfId="0" '
+            f'applyNumberFormat="1" applyFont="1" applyBorder="1" applyAlignment="1">{XLSX_XF_ALIGNMENT}</xf>'
+        )
+    num_fmts = f'<numFmts count="{len(custom_formats)}">{"".join(custom_formats)}</numFmts>' if custom_formats else ""
+    return XML_DECLARATION + (
+        f'<styleSheet xmlns="{SPREADSHEET_NS}">{num_fmts}'
+        '<fonts count="3">'
+        '<font><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+        f'<font><b/><sz val="{HEADER_FONT.sz:g}"/><color rgb="{HEADER_FONT.color.rgb}"/></font>'
+        f'<font><sz val="{DATA_FONT.sz:g}"/></font>'
+        '</fonts>'
+        '<fills count="3">'
+        '<fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill>'
+        f'<fill><patternFill patternType="solid"><fgColor rgb="{HEADER_FILL.fgColor.rgb}"/>'
+        f'<bgColor rgb="{HEADER_FILL.bgColor.rgb}"/></patternFill></fill>'
+        '</fills>'
+        '<borders count="2">'
+        '<border><left/><right/><top/><bottom/><diagonal/></border>'
+        '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+        '</borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{2 + len(data_xfs)}">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" '
+        f'applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">{XLSX_XF_ALIGNMENT}</xf>'
+        f'{"".join(data_xfs)}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    )
+
+# 인라인 문자열 이스케이프 표 - &, <, >는 엔티티로, XML에 허용되지 않는 제어 문자는 제거 (한 번의 translate로 처리)
+XML_TEXT_TRANSLATION = str.maketrans({
+    **dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)]),
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+})
+XML_TEXT_SPECIAL_RE = re.compile(r'[&<>\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _fast_xlsx_text(value: str, search=XML_TEXT_SPECIAL_RE.search) -> str:
+    """인라인 문자열용 이스케이프 - 대부분의 값은 특수 문자가 없으므로 검사 후 필요할 때만 변환"""
+    return value.translate(XML_TEXT_TRANSLATION) if search(value) else value
+
+def _fast_xlsx_cell(ref: str, value: Any, style_id: int) -> str:
+    """셀 하나의 XML - 숫자는 <v>, 그 외는 인라인 문자열 ('='로 시작해도 수식이 아닌 텍스트)"""
+    if value is None or value == "":
+        return f'<c r="{ref}" s="{style_id}"/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" s="{style_id}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}" s="{style_id}"><v>{value}</v></c>'
+    return f'<c r="{ref}" s="{style_id}" t="inlineStr"><is><t xml:space="preserve">{_fast_xlsx_text(str(value))}</t></is></c>'
+
+def _fast_xlsx(
+    out: BinaryIO,
+    title: str,
+    fields: List[str],
+    labels: Dict[str, str],
+    rows: List[Dict[str, Any]],
+    auto_filter: bool,
+    field_formats: Dict[str, str],
+    compression: int = zipfile.ZIP_DEFLATED
+) -> None:
+    """단일 시트 엑셀 파일을 XML 문자열로 직접 생성하여 out에 기록 - 서식은 write_sheet 결과와 동일"""
+    number_formats = list(dict.fromkeys(('@', '#,##0', '#,##0.00', *field_formats.values())))
+    style_ids = {number_format: idx for idx, number_format in enumerate(number_formats, 2)}
+    # 열 문자(A, B, ...)는 시트마다 한 번만 계산하여 셀 주소 생성에 재사용
+    letters = tuple(get_column_letter(col_idx) for col_idx in range(1, len(fields) + 1))
+    # 데이터 셀 스타일은 열마다 값 타입별로 한 번만 결정
+    column_styles = [
+        {value_type: style_ids[number_format] for value_type, number_format in column_number_formats(field_formats.get(field)).items()}
+        for field in fields
+    ]
+    text_style = style_ids['@']
+    defaults = ("",) * len(fields)
+    # 필터를 걸 마지막 열 (필터 없으면 None)
+    last_col = letters[-1] if auto_filter and letters else None
+
+    with zipfile.ZipFile(out, "w", compression, compresslevel=EXPORT_ZIP_COMPRESSLEVEL) as zf:
+        zf.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", XLSX_ROOT_RELS_XML)
+        zf.writestr("xl/workbook.xml", _fast_xlsx_workbook(title, last_col))
+        zf.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELS_XML)
+        zf.writestr("xl/styles.xml", _fast_xlsx_styles(number_formats))
+
+        # 시트 XML은 행 단위로 압축 스트림에 기록
+        with zf.open("xl/worksheets/sheet1.xml", "w") as raw, TextIOWrapper(raw, encoding="utf-8") as sheet:
+            write = sheet.write
+            write(f'{XML_DECLARATION}<worksheet xmlns="{SPREADSHEET_NS}">')
+            if letters:
+                # 시트 범위는 행/열 수로 미리 알 수 있으므로 직접 기록 (읽는 쪽에서 전체 셀을 훑지 않아도 됨)
+                write(f'<dimension ref="A1:{letters[-1]}{len(rows) + 1}"/>')
+                write(f'<cols><col min="1" max="{len(letters)}" width="20" customWidth="1"/></cols>')
+            write('<sheetData>')
+
+            header = "".join(
+                f'<c r="{letter}1" s="1" t="inlineStr"><is><t xml:space="preserve">{_fast_xlsx_text(str(labels.get(field, field)))}</t></is></c>'
+                for letter, field in zip(letters, fields)
             )
+            write(f'<row r="1">{header}</row>')
 
-            # 헤더 행 추가
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=10)
-            
-            for col_idx, field in enumerate(fields, 1):
-                cell = ws.cell(row=1, column=col_idx)
-                cell.value = field_labels.get(field, field)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = center_alignment
-                cell.border = thin_border
-
-            # 데이터 행 추가
-            data_font = Font(size=10)
-            for row_idx, row in enumerate(data, 2):
-                for col_idx, field in enumerate(fields, 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    value = row.get(field, "")
-                    cell.value = value
-                    # 모든 셀을 텍스트 형식으로 설정
-                    cell.number_format = '@'
-                    cell.alignment = center_alignment
-                    cell.border = thin_border
-                    cell.font = data_font
-
-            # 열 너비 자동 조정
-            for col_idx, field in enumerate(fields, 1):
-                column_letter = chr(64 + col_idx)  # A=65, B=66, etc.
-                ws.column_dimensions[column_letter].width = 20
+            for row_idx, row in enumerate(rows, 2):
+                cells = "".join(
+                    _fast_xlsx_cell(f"{letter}{row_idx}", value, styles.get(type(value), text_style))
+                    for letter, value, styles in zip(letters, map(row.get, fields, defaults), column_styles)
+                )
+                write(f'<row r="{row_idx}">{cells}</row>')
 
+            write('</sheetData>')
             # 첫 행에 필터 설정
-            if fields:
-                last_col = chr(64 + len(fields))
-                ws.auto_filter.ref = f"A1:{last_col}1"
+            if last_col:
+                write(f'<autoFilter ref="A1:{last_col}1"/>')
+            write('</worksheet>')
+# ============ 대용량 내보내기 끝 ============
+
+# 엑셀 파일은 이 크기까지 메모리에 두고, 넘으면 임시 파일로 옮겨짐
+EXPORT_SPOOL_MAX_BYTES = 50 * 1024 * 1024
+
+def _write_xlsx(request_data: Dict[str, Any], out: BinaryIO, compression: int = zipfile.ZIP_DEFLATED) -> None:
+    """내보내기 요청으로 엑셀 파일을 만들어 out에 기록 - 동기 함수이므로 스레드풀에서 호출
+
+    compression이 ZIP_STORED이면 zip 항목을 압축하지 않음 (/api/export-raw에서 HTTP GZip으로 대신 압축)
+    """
+    # 필드별 숫자 표시 형식 (예: {"currentVcoreRatio": '"1:"0.0'})
+    field_formats = request_data.get("fieldFormats", {})
+
+    sheet_specs = export_sheet_specs(request_data)
+
+    # 행이 많은 단일 시트는 XML 직접 생성 경로 사용
+    if len(sheet_specs) == 1 and len(sheet_specs[0][3]) > FAST_XLSX_MIN_ROWS:
+        _fast_xlsx(out, *sheet_specs[0], field_formats, compression)
+        return
+
+    # 쓰기 전용 워크북 - 셀 객체를 메모리에 유지하지 않고 행 단위로 기록
+    wb = Workbook(write_only=True)
+    style_names = add_export_styles(wb, field_formats)
+    for title, fields, labels, rows, auto_filter in sheet_specs:
+        write_sheet(wb, title, fields, labels, rows, auto_filter, field_formats, style_names)
 
-        # 임시 파일로 저장
-        temp_file = tempfile.NamedTemporaryFile(mode='w+b', delete=False, suffix='.xlsx')
-        temp_path = temp_file.name
-        temp_file.close()
+    # 저장 - wb.save()는 압축 수준을 지정할 수 없어 openpyxl의 ExcelWriter를 직접 사용
+    with zipfile.ZipFile(out, "w", compression, allowZip64=True, compresslevel=EXPORT_ZIP_COMPRESSLEVEL) as archive:
+        ExcelWriter(wb, archive).save()
 
-        wb.save(temp_path)
+def _read_gzip_chunk(file: BinaryIO, chunk_size: int, compressor) -> Tuple[bytes, bool]:
+    """파일에서 청크를 읽어 gzip 압축 - 파일 끝이면 남은 압축 데이터와 함께 완료 표시"""
+    chunk = file.read(chunk_size)
+    if not chunk:
+        return compressor.flush(), True
+    return compressor.compress(chunk), False
+
+async def iter_file_chunks(file: BinaryIO, chunk_size: int = 64 * 1024, gzip: bool = False):
+    """파일을 청크 단위로 읽어 전송 - 전송이 끝나거나 중단되면 파일 닫기
+
+    gzip이면 각 청크를 스레드풀에서 gzip 압축 (이벤트 루프에서 압축하지 않음)
+    """
+    try:
+        if not gzip:
+            while chunk := await run_in_threadpool(file.read, chunk_size):
+                yield chunk
+            return
+
+        compressor = zlib.compressobj(EXPORT_ZIP_COMPRESSLEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip 헤더 포함
+        done = False
+        while not done:
+            chunk, done = await run_in_threadpool(_read_gzip_chunk, file, chunk_size, compressor)
+            if chunk:
+                yield chunk
+    finally:
+        file.close()
+
+async def export_response(request: Request, compression: int, gzip: bool = False) -> Response:
+    """엑셀 내보내기 공통 처리 - 요청 본문 파싱, 엑셀 생성, 파일 응답 (gzip이면 전송 시 gzip 인코딩)"""
+    # 행이 많은 요청 본문은 orjson으로 직접 파싱 (FastAPI 기본 json.loads + dict 검증 생략)
+    try:
+        request_data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+    if not isinstance(request_data, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+
+    try:
+        filename = request_data.get("filename", "export")
+
+        headers = attachment_headers(f"{filename}.xlsx")
+
+        # 엑셀 생성은 스레드풀에서 실행 - 프로세스 풀은 요청 데이터 pickle 비용이 더 커서 사용하지 않음
+        # 스풀 파일에 저장한 뒤 청크 단위로 전송 (큰 파일은 메모리 대신 디스크 사용)
+        spool = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES, mode="w+b")
+        try:
+            await run_in_threadpool(_write_xlsx, request_data, spool, compression)
+        except BaseException:
+            spool.close()
+            raise
+        if gzip:
+            # 압축 후 크기는 전송이 끝나야 알 수 있으므로 Content-Length 없이 전송
+            headers["Content-Encoding"] = "gzip"
+            headers["Vary"] = "Accept-Encoding"
+        else:
+            headers["Content-Length"] = str(spool.tell())
+        spool.seek(0)
 
         # 파일 응답
-        return FileResponse(
-            path=temp_path,
-            filename=f"{filename}.xlsx",
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+        return StreamingResponse(iter_file_chunks(spool, gzip=gzip), media_type=XLSX_MEDIA_TYPE, headers=headers)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/export-xlsx")
+async def export_xlsx(request: Request):
+    """엑셀 형식으로 데이터 내보내기"""
+    return await export_response(request, zipfile.ZIP_DEFLATED)
+
+@app.post("/api/export-raw")
+async def export_raw(request: Request):
+    """엑셀 내보내기 (zip 비압축) - 압축은 HTTP GZip으로 전송 중에 처리, CPU보다 네트워크가 여유 있는 경우용"""
+    # 클라이언트가 gzip을 받을 수 있을 때만 전송 단계에서 압축
+    gzip = "gzip" in request.headers.get("accept-encoding", "")
+    return await export_response(request, zipfile.ZIP_STORED, gzip)
+
+def index_response(request: Request) -> Response:
+    """index.html 응답 - 브라우저가 보낸 If-None-Match가 ETag와 같거나 *이면 본문 없이 304"""
+    headers = {"ETag": INDEX_ETAG, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if INDEX_ETAG in tags or "*" in tags:
+        return Response(status_code=304, headers=headers)
+    return Response(content=INDEX_HTML, media_type="text/html", headers=headers)
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """루트 경로 - index.html 반환"""
-    index_path = os.path.join(STATIC_DIR, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+    if INDEX_HTML is not None:
+        return index_response(request)
     return {"message": "Nutanix Cluster Manager API", "status": "running"}
 
 @app.get("/{full_path:path}")
-async def serve_spa(full_path: str):
+async def serve_spa(full_path: str, request: Request):
     """SPA용 fallback - 모든 경로를 index.html로"""
     # API 경로는 제외
     if full_path.startswith("api/"):
         raise HTTPException(status_code=404, detail="Not found")
     
-    # 정적 파일 직접 서빙 (.jpg, .png, .css, .js 등)
-    if "." in full_path.split("/")[-1]:
-        file_path = os.path.join(STATIC_DIR, full_path)
-        if os.path.exists(file_path):
-            return FileResponse(file_path)
+    # 상위 경로/절대 경로 요청 거부
+    if full_path.startswith("/") or ".." in full_path.split("/"):
+        raise HTTPException(status_code=404, detail="Not found")
+    
+    # index.html 직접 요청도 루트와 같은 ETag/304 처리
+    if full_path == "index.html" and INDEX_HTML is not None:
+        return index_response(request)
+    
+    # 정적 파일 직접 서빙 (.jpg, .png, .css, .js 등) - 시작 시 수집한 목록에 있는 파일만
+    if full_path in STATIC_FILES:
+        return FileResponse(os.path.join(STATIC_DIR, full_path))
     
-    # 나머지는 SPA fallback
-    index_path = os.path.join(STATIC_DIR, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+    # 확장자가 있는 경로는 없는 정적 파일 요청이므로 404 (대소문자가 다른 경로 포함 - index.html로 대신 응답하지 않음)
+    if "." in full_path.rsplit("/", 1)[-1]:
+        raise HTTPException(status_code=404, detail="Not found")
+    
+    # 나머지(확장자 없는 클라이언트 라우트)는 SPA fallback
+    if INDEX_HTML is not None:
+        return index_response(request)
     raise HTTPException(status_code=404, detail="Not found")
 
 def open_browser():
@@ -971,10 +1271,18 @@ def open_browser():
     webbrowser.open('http://localhost:8000')
 
 if __name__ == "__main__":
+    # PyInstaller exe에서 프로세스 풀 워커가 앱을 다시 실행하지 않도록 함
+    multiprocessing.freeze_support()
     import uvicorn
-    # 브라우저 자동 열기 (1초 후)
+    # 브라우저 자동 열기 (1.5초 후)
     timer = threading.Timer(1.5, open_browser)
     timer.daemon = True
     timer.start()
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http는 기본값(auto)으로 uvloop(Windows 제외)/httptools가 설치되어 있으면 자동 사용
+    # 앱 객체를 직접 전달 - "backend:app" 문자열은 exe에서 모듈을 다시 import하므로 사용하지 않음
+    try:
+        uvicorn.run(app, host="0.0.0.0", port=8000, access_log=False)
+    finally:
+        # 포트 사용 중 등으로 서버가 바로 종료되면 브라우저를 열지 않음
+        timer.cancel()
@@ -250,6 +250,21 @@ const DataExplorer: React.FC<DataExplorerProps> = ({ cluster }) => {
     return [...sorted, ...totalRows];
   }, [data, sortFieldMemory, sortDirectionMemory]);
 
+  // 숫자 필드 표시 형식 (백엔드는 숫자 그대로 반환)
+  const formatCellValue = (fieldKey: string, value: DataRow[string]) => {
+    if (typeof value !== 'number') return value;
+    if (category === 'Performance') {
+      return fieldKey === 'iops' ? value.toLocaleString('en-US') : value.toFixed(2);
+    }
+    return value;
+  };
+
+  // vCore 비율 표시 (1:N) - 호스트는 소수 1자리, Total은 2자리
+  const formatVcoreRatio = (row: DataRow, value: DataRow[string]) => {
+    if (typeof value !== 'number') return value;
+    return `1:${value.toFixed(row.hostName === 'Total' ? 2 : 1)}`;
+  };
+
   const toggleClusterExpansion = (clusterName: string) => {
     setExpandedClusters(prev => {
       const newSet = new Set(prev);
@@ -273,7 +288,10 @@ const DataExplorer: React.FC<DataExplorerProps> = ({ cluster }) => {
 
       // Resources는 특별한 처리 필요
       if (category === 'Resources') {
-        const cpuData = data.filter(row => row.table === 'CPU');
+        // Total 행의 vCore 비율은 화면과 같이 소수 2자리 문자열로 전송 (엑셀 셀 형식은 열 전체에 적용되므로)
+        const cpuData = data
+          .filter(row => row.table === 'CPU')
+          .map(row => row.hostName === 'Total' ? { ...row, currentVcoreRatio: formatVcoreRatio(row, row.currentVcoreRatio) } : row);
         const memoryData = data.filter(row => row.table === 'Memory');
         
         // CPU 필드
@@ -318,7 +336,12 @@ const DataExplorer: React.FC<DataExplorerProps> = ({ cluster }) => {
             cpuFields: cpuFields,
             memoryFields: memoryFields,
             cpuFieldLabels: cpuFieldLabels,
-            memoryFieldLabels: memoryFieldLabels
+            memoryFieldLabels: memoryFieldLabels,
+            // 호스트 행은 화면과 같이 소수 1자리
+            fieldFormats: {
+              recommendVcoreRatio: '"1:"0',
+              currentVcoreRatio: '"1:"0.0'
+            }
           }),
         });
 
@@ -625,8 +648,8 @@ const DataExplorer: React.FC<DataExplorerProps> = ({ cluster }) => {
                       <td className="px-3 py-2 text-sm text-gray-900 text-center">{row.numaOver}</td>
                       <td className="px-3 py-2 text-sm text-gray-900 text-center">{row.pCore}</td>
                       <td className="px-3 py-2 text-sm text-gray-900 text-center">{row.useVCore}</td>
-                      <td className="px-3 py-2 text-sm text-gray-900 text-center">{row.recommendVcoreRatio}</td>
-                      <td className="px-3 py-2 text-sm text-gray-900 text-center">{row.currentVcoreRatio}</td>
+                      <td className="px-3 py-2 text-sm text-gray-900 text-center">{`1:${row.recommendVcoreRatio}`}</td>
+                      <td className="px-3 py-2 text-sm text-gray-900 text-center">{formatVcoreRatio(row, row.currentVcoreRatio)}</td>
                       <td className={`px-3 py-2 text-sm font-semibold text-center ${row.result === 'PASS' ? 'text-green-600' : 'text-red-600'}`}>
                         {row.result}
                       </td>
@@ -771,10 +794,10 @@ const DataExplorer: React.FC<DataExplorerProps> = ({ cluster }) => {
                               className={`transition-transform ${isExpanded ? 'rotate-90' : ''}`}
                               size={16} 
                             />
-                            <span className="font-semibold">{row[fieldKey]}</span>
+                            <span className="font-semibold">{formatCellValue(fieldKey, row[fieldKey])}</span>
                           </button>
                         ) : (
-                          row[fieldKey]
+                          formatCellValue(fieldKey, row[fieldKey])
                         )}
                       </td>
                     ))}
@@ -30,7 +30,7 @@ export const FIELD_DEFINITIONS: Record<Category, { key: string; label: string }[
     { key: 'entityName', label: 'Entity Name' },
     { key: 'iops', label: 'IOPS' },
     { key: 'latency', label: 'Latency (ms)' },
-    { key: 'bandwidth', label: 'Bandwidth' },
+    { key: 'bandwidth', label: 'Bandwidth (MB/s)' },
     { key: 'cpuUsage', label: 'CPU Usage (%)' },
     { key: 'memoryUsage', label: 'Memory Usage (%)' },
   ],